@@ -3,12 +3,58 @@
 Interactive solar system with realistic orbits, scaling options, and camera controls
 """
 
+import math
+import sys
+
 import numpy as np
 import matplotlib.pyplot as plt
 from mpl_toolkits.mplot3d import Axes3D
+from mpl_toolkits.mplot3d.art3d import Poly3DCollection
 from matplotlib.animation import FuncAnimation
 from matplotlib.widgets import Button, Slider
 import matplotlib.patches as mpatches
+import matplotlib.colors as mcolors
+
+try:
+    from numba import njit
+except ImportError:  # Numba is optional; fall back to the NumPy stepper
+    njit = None
+
+try:
+    from vispy import app, scene
+    from vispy.color import Color
+except ImportError:  # VisPy is optional; only visualize_vispy needs it
+    scene = None
+
+
+if njit is not None:
+    # Matches the SoA arrays' exact dtypes and layouts, so the one
+    # up-front compile serves every call
+    _STEP_SIGNATURE = 'void(f8[::1], f8[::1], f8[::1], f8[::1], f8[::1], f4[:, ::1], f8)'
+    
+    @njit(cache=True, boundscheck=False, fastmath=True)
+    def _step(angles, ang_vel, dist, cos_tilt, sin_tilt, out, dt):
+        """Advance orbital angles by dt days and write positions (AU) into out"""
+        for i in range(angles.shape[0]):
+            angles[i] += ang_vel[i] * dt
+            y = dist[i] * math.sin(angles[i])
+            out[i, 0] = dist[i] * math.cos(angles[i])
+            out[i, 1] = y * cos_tilt[i]
+            out[i, 2] = y * sin_tilt[i]  # Apply orbital tilt
+else:
+    def _step(angles, ang_vel, dist, cos_tilt, sin_tilt, out, dt):
+        """Advance orbital angles by dt days and write positions (AU) into out"""
+        angles += ang_vel * dt
+        y = dist * np.sin(angles)
+        out[:, 0] = dist * np.cos(angles)
+        out[:, 1] = y * cos_tilt
+        out[:, 2] = y * sin_tilt  # Apply orbital tilt
+
+
+def warm_up_stepper():
+    """Compile (or load from Numba's cache) the orbit stepper before animating"""
+    if njit is not None:
+        _step.compile(_STEP_SIGNATURE)
 
 
 class CelestialBody:
@@ -32,44 +78,56 @@ class CelestialBody:
         self.orbital_period = orbital_period  # days
         self.color = color
         self.tilt = np.radians(tilt)
-        self.angle = np.random.uniform(0, 2 * np.pi)  # Random starting position
-        self.position = np.array([0.0, 0.0, 0.0])
-        
-    def update_position(self, time_step):
-        """Update planet position based on orbital mechanics"""
-        # Angular velocity (radians per time step)
-        angular_velocity = (2 * np.pi) / self.orbital_period
-        self.angle += angular_velocity * time_step
-        
-        # Calculate position in orbital plane
-        x = self.distance * np.cos(self.angle)
-        y = self.distance * np.sin(self.angle)
-        z = y * np.sin(self.tilt)  # Apply orbital tilt
-        y = y * np.cos(self.tilt)
-        
-        self.position = np.array([x, y, z])
-        return self.position
+        # Orbital state is held in arrays so SolarSystem can share them
+        self._angles = np.zeros(1)
+        self._positions = np.zeros((1, 3), dtype=np.float32)
+        self._index = 0
+    
+    def bind(self, angles, positions, index):
+        """Read orbital state from shared (N,) angle and (N, 3) position arrays"""
+        self._angles = angles
+        self._positions = positions
+        self._index = index
+    
+    @property
+    def angle(self):
+        """Current orbital angle (radians)"""
+        return self._angles[self._index]
+    
+    @property
+    def position(self):
+        """Current position (AU), a view into the shared position array"""
+        return self._positions[self._index]
 
 
 class SolarSystem:
     """Solar system simulator with interactive controls"""
     
-    def __init__(self, scale_mode='logarithmic'):
+    # Planet sphere resolutions, picked per planet from its on-screen size
+    sphere_resolutions = (6, 8, 10, 14, 20)
+    
+    def __init__(self, scale_mode='logarithmic', seed=None):
         """
         Initialize solar system
         
         Args:
             scale_mode: 'realistic', 'logarithmic', or 'artistic'
+            seed: Seed for the random starting positions (None for a new layout each run)
         """
         self.scale_mode = scale_mode
+        self._rng = np.random.default_rng(seed)
         self.time_step = 1  # days per frame
         self.bodies = []
-        self.trails = {}  # Store orbital trails
         self.trail_length = 100
         self.paused = False
         self.show_orbits = True
         self.show_labels = True
         
+        # Unit sphere meshes keyed by resolution; only radius and center
+        # change per body, so the trig grids are built once
+        self._unit_spheres = {res: self._build_unit_sphere(res)
+                              for res in (*self.sphere_resolutions, 30)}
+        
         self._initialize_bodies()
         
     def _initialize_bodies(self):
@@ -90,49 +148,276 @@ class SolarSystem:
         for data in bodies_data:
             body = CelestialBody(*data)
             self.bodies.append(body)
-            if body.name != 'Sun':
-                self.trails[body.name] = []
-    
-    def get_scaled_radius(self, radius):
-        """Scale planet radius for visualization"""
-        if self.scale_mode == 'realistic':
-            return radius / 100000  # Very small, hard to see
-        elif self.scale_mode == 'logarithmic':
-            return 0.02 + np.log10(radius) * 0.01  # Logarithmic scale
-        else:  # artistic
-            return 0.05 + (radius / 100000) * 2  # Exaggerated but visible
-    
-    def get_scaled_distance(self, distance):
-        """Scale orbital distance for visualization"""
-        if self.scale_mode == 'realistic':
-            return distance
-        elif self.scale_mode == 'logarithmic':
-            if distance == 0:
-                return 0
-            return np.log10(distance * 10 + 1) * 3
-        else:  # artistic
-            return distance ** 0.7 * 5  # Compressed distances
+        
+        # Planet orbital state as arrays (Sun stays fixed at the origin)
+        planets = self.bodies[1:]
+        self._angles = self._rng.uniform(0, 2 * np.pi, size=len(planets))  # Random starting positions
+        self._positions = np.zeros((len(planets), 3), dtype=np.float32)
+        self._ang_vel = np.array([2 * np.pi / b.orbital_period for b in planets])
+        self._dist = np.array([b.distance for b in planets])
+        self._cos_tilt = np.cos([b.tilt for b in planets])
+        self._sin_tilt = np.sin([b.tilt for b in planets])
+        
+        for i, body in enumerate(planets):
+            body.bind(self._angles, self._positions, i)
+        
+        # Orbital trails as a ring buffer; unfilled slots stay NaN so they aren't drawn
+        self._trail_buf = np.full((len(planets), self.trail_length, 3), np.nan, dtype=np.float32)
+        self._trail_head = 0
+        
+        self._apply_scale_mode()
+    
+    def set_scale_mode(self, scale_mode):
+        """
+        Change the scale mode
+        
+        Args:
+            scale_mode: 'realistic', 'logarithmic', or 'artistic'
+        
+        Takes effect the next time the visualization is opened.
+        """
+        self.scale_mode = scale_mode
+        self._apply_scale_mode()
+    
+    def _apply_scale_mode(self):
+        """Cache everything that depends only on the scale mode"""
+        # Unknown modes fall back to artistic
+        self.get_scaled_radius = getattr(self, f'_scaled_radius_{self.scale_mode}',
+                                         self._scaled_radius_artistic)
+        self.get_scaled_distance = getattr(self, f'_scaled_distance_{self.scale_mode}',
+                                           self._scaled_distance_artistic)
+        
+        # Planet positions (AU) are drawn scaled by the 1 AU distance
+        self._pos_scale = float(self.get_scaled_distance(1))
+        
+        # Per-body tables, indexed like self.bodies
+        self._radii_scaled = np.array([self.get_scaled_radius(b.radius) for b in self.bodies],
+                                      dtype=np.float32)
+        self._dist_scaled = np.array([self.get_scaled_distance(b.distance) for b in self.bodies],
+                                     dtype=np.float32)
+        
+        # Sphere detail from the rough on-screen radius: the plot box spans about
+        # 1000 px of the figure across 2.4x the widest orbit
+        px_per_unit = 1000 / (2.4 * self._dist_scaled.max())
+        resolutions = np.array(self.sphere_resolutions)
+        detail = np.sqrt(self._radii_scaled[1:] * px_per_unit) * 4
+        detail = np.clip(detail, resolutions[0], resolutions[-1])
+        self._planet_res = resolutions[np.searchsorted(resolutions, detail)]  # Round up
+        
+        # Orbit paths
+        orbit_points = 100
+        angles = np.linspace(0, 2 * np.pi, orbit_points)
+        distance = self._dist_scaled[1:, None]
+        orbit_y = distance * np.sin(angles)
+        self._orbit_xyz = np.empty((len(self.bodies) - 1, orbit_points, 3), dtype=np.float32)
+        self._orbit_xyz[..., 0] = distance * np.cos(angles)
+        self._orbit_xyz[..., 1] = orbit_y * self._cos_tilt[:, None]
+        self._orbit_xyz[..., 2] = orbit_y * self._sin_tilt[:, None]
+    
+    # Radius and distance scaling, one implementation per scale mode. The
+    # active pair is bound to get_scaled_radius/get_scaled_distance when the
+    # mode is set, so calls don't re-check the mode
+    def _scaled_radius_realistic(self, radius):
+        """Scale planet radius for visualization (true proportions)"""
+        return radius / 100000  # Very small, hard to see
+    
+    def _scaled_radius_logarithmic(self, radius):
+        """Scale planet radius for visualization (logarithmic)"""
+        return 0.02 + np.log10(radius) * 0.01  # Logarithmic scale
+    
+    def _scaled_radius_artistic(self, radius):
+        """Scale planet radius for visualization (exaggerated)"""
+        return 0.05 + (radius / 100000) * 2  # Exaggerated but visible
+    
+    def _scaled_distance_realistic(self, distance):
+        """Scale orbital distance for visualization (true proportions)"""
+        return distance
+    
+    def _scaled_distance_logarithmic(self, distance):
+        """Scale orbital distance for visualization (logarithmic)"""
+        if distance == 0:
+            return 0
+        return np.log10(distance * 10 + 1) * 3
+    
+    def _scaled_distance_artistic(self, distance):
+        """Scale orbital distance for visualization (compressed)"""
+        return distance ** 0.7 * 5  # Compressed distances
     
     def update(self, frame):
         """Update all bodies for animation"""
         if not self.paused:
-            for body in self.bodies[1:]:  # Skip sun
-                body.update_position(self.time_step)
-                
-                # Update trail
-                if body.name in self.trails:
-                    self.trails[body.name].append(body.position.copy())
-                    if len(self.trails[body.name]) > self.trail_length:
-                        self.trails[body.name].pop(0)
+            # Advance all planets at once (angular velocity in radians per day)
+            _step(self._angles, self._ang_vel, self._dist, self._cos_tilt, self._sin_tilt,
+                  self._positions, float(self.time_step))
+            
+            # Update trails, overwriting the oldest point
+            self._trail_buf[:, self._trail_head] = self._positions
+            self._trail_head = (self._trail_head + 1) % self.trail_length
+    
+    @staticmethod
+    def _build_unit_sphere(resolution):
+        """Build unit sphere mesh centered at the origin"""
+        u = np.linspace(0, 2 * np.pi, resolution, dtype=np.float32)[:, None]
+        v = np.linspace(0, np.pi, resolution, dtype=np.float32)[None, :]
+        sin_v = np.sin(v)
+        x = np.cos(u) * sin_v
+        y = np.sin(u) * sin_v
+        z = np.broadcast_to(np.cos(v), x.shape)  # Constant along u, so no copy
+        return x, y, z
     
     def create_sphere(self, radius, center=(0, 0, 0), resolution=20):
         """Create sphere vertices for planet rendering"""
-        u = np.linspace(0, 2 * np.pi, resolution)
-        v = np.linspace(0, np.pi, resolution)
-        x = radius * np.outer(np.cos(u), np.sin(v)) + center[0]
-        y = radius * np.outer(np.sin(u), np.sin(v)) + center[1]
-        z = radius * np.outer(np.ones(np.size(u)), np.cos(v)) + center[2]
-        return x, y, z
+        if resolution not in self._unit_spheres:
+            self._unit_spheres[resolution] = self._build_unit_sphere(resolution)
+        x, y, z = self._unit_spheres[resolution]
+        return radius * x + center[0], radius * y + center[1], radius * z + center[2]
+    
+    @staticmethod
+    def _surface_quads(x, y, z):
+        """Split a surface mesh into quads, in the order plot_surface builds them"""
+        xyz = np.stack([x, y, z], axis=-1)
+        quads = np.stack([xyz[:-1, :-1], xyz[:-1, 1:], xyz[1:, 1:], xyz[1:, :-1]], axis=2)
+        return quads.reshape(-1, 4, 3)
+    
+    def _build_static_scene(self, fig, ax):
+        """Draw everything that stays fixed during playback"""
+        # Get maximum orbital distance for plot limits
+        max_distance = self._dist_scaled.max()
+        
+        # Orbital paths
+        self._orbit_lines = []
+        for body, orbit in zip(self.bodies[1:], self._orbit_xyz):  # Skip sun
+            line, = ax.plot(orbit[:, 0], orbit[:, 1], orbit[:, 2],
+                            color=body.color, alpha=0.3, linestyle='--', linewidth=0.5)
+            self._orbit_lines.append(line)
+        
+        # Sun label (the Sun itself is drawn with the planets)
+        sun = self.bodies[0]
+        sun_radius = self._radii_scaled[0]
+        self._sun_label = ax.text(0, 0, sun_radius * 1.5, sun.name, clip_on=True,
+                                  fontsize=10, fontweight='bold', color='white')
+        
+        # Set plot properties
+        ax.set_xlim([-max_distance * 1.2, max_distance * 1.2])
+        ax.set_ylim([-max_distance * 1.2, max_distance * 1.2])
+        ax.set_zlim([-max_distance * 0.5, max_distance * 0.5])
+        
+        ax.set_xlabel('X (AU)', color='white', fontsize=10)
+        ax.set_ylabel('Y (AU)', color='white', fontsize=10)
+        ax.set_zlabel('Z (AU)', color='white', fontsize=10)
+        
+        # Style
+        ax.set_facecolor('black')
+        fig.patch.set_facecolor('black')
+        ax.grid(True, alpha=0.2)
+        ax.xaxis.pane.fill = False
+        ax.yaxis.pane.fill = False
+        ax.zaxis.pane.fill = False
+        
+        # The title sits outside the blitted axes area, so it is redrawn with the
+        # static scene when the pause state changes
+        self._title = ax.set_title('', color='white', fontsize=14, fontweight='bold', pad=20)
+        self._update_title()
+        
+        # Add legend
+        legend_elements = [
+            mpatches.Patch(color=body.color, label=f"{body.name} ({body.orbital_period:.0f}d)")
+            for body in self.bodies[:5]  # First 5 planets
+        ]
+        ax.legend(handles=legend_elements, loc='upper right', 
+                 fontsize=8, facecolor='black', edgecolor='white', 
+                 labelcolor='white', framealpha=0.8)
+    
+    def _update_title(self):
+        """Show the scale mode and pause state in the title"""
+        title_text = f'Solar System Simulator - Scale: {self.scale_mode.title()}'
+        if self.paused:
+            title_text += ' [PAUSED]'
+        self._title.set_text(title_text)
+    
+    def _build_dynamic_artists(self, ax):
+        """Create the body, label and trail artists moved by _update_dynamic"""
+        self._labels = []
+        self._trail_lines = []
+        for body in self.bodies[1:]:
+            self._labels.append(ax.text(0, 0, 0, body.name, clip_on=True,
+                                        fontsize=8, color='white'))
+            line, = ax.plot([], [], [], color=body.color, alpha=0.6, linewidth=1.5)
+            self._trail_lines.append(line)
+        
+        # All bodies share one collection, so each frame projects and depth
+        # sorts a single artist. Planets translate rigidly: size their unit
+        # sphere quads once, then translate them into their slice of the
+        # shared vertex buffer every frame
+        sun_quads = self._surface_quads(*self.create_sphere(self._radii_scaled[0], resolution=30))
+        self._planet_quads = [self._surface_quads(*self._unit_spheres[res]) * radius
+                              for res, radius in zip(self._planet_res, self._radii_scaled[1:])]
+        body_quads = [sun_quads, *self._planet_quads]
+        
+        ends = np.cumsum([len(quads) for quads in body_quads])
+        self._planet_slices = [slice(start, end) for start, end in zip(ends[:-1], ends[1:])]
+        self._body_verts = np.concatenate(body_quads)
+        
+        alphas = [1.0] + [0.9] * len(self._planet_quads)
+        face_colors = np.concatenate([
+            np.tile(mcolors.to_rgba(body.color, alpha), (len(quads), 1))
+            for body, alpha, quads in zip(self.bodies, alphas, body_quads)
+        ])
+        self._bodies_surf = Poly3DCollection(self._body_verts, facecolors=face_colors, shade=True)
+        ax.add_collection3d(self._bodies_surf)
+        
+        self._scaled_positions = np.empty_like(self._positions)
+        self._scaled_trails = np.empty_like(self._trail_buf)
+        
+        # Blitted frames only redraw these; full redraws leave them out. Labels
+        # are clipped so nothing is drawn outside the blitted area
+        for artist in self._dynamic_artists():
+            artist.set_animated(True)
+    
+    def _dynamic_artists(self):
+        """Artists redrawn on every animation frame"""
+        return (self._bodies_surf, *self._trail_lines, self._sun_label, *self._labels)
+    
+    def _scale_trails(self, out):
+        """Write all trails scaled for display into out, oldest point first"""
+        # Unrolling the ring at the head keeps lines from jumping at the seam
+        head = self._trail_head
+        tail = self.trail_length - head
+        np.multiply(self._trail_buf[:, head:], self._pos_scale, out=out[:, :tail])
+        np.multiply(self._trail_buf[:, :head], self._pos_scale, out=out[:, tail:])
+        return out
+    
+    def _update_dynamic(self, frame):
+        """Advance the simulation and update the moving artists"""
+        # Update positions
+        self.update(frame)
+        
+        self._sun_label.set_visible(self.show_labels)
+        
+        np.multiply(self._positions, self._pos_scale, out=self._scaled_positions)
+        self._scale_trails(self._scaled_trails)
+        # Labels are blitted over the bodies, so hide those of planets inside the Sun
+        outside_sun = np.linalg.norm(self._scaled_positions, axis=1) > self._radii_scaled[0]
+        for i, scaled_pos in enumerate(self._scaled_positions):
+            radius = self._radii_scaled[i + 1]
+            
+            # Move planet
+            np.add(self._planet_quads[i], scaled_pos, out=self._body_verts[self._planet_slices[i]])
+            
+            # Move label
+            label = self._labels[i]
+            label.set_position_3d((scaled_pos[0], scaled_pos[1], scaled_pos[2] + radius * 2))
+            label.set_visible(self.show_labels and outside_sun[i])
+            
+            # Update trail
+            trail = self._scaled_trails[i]
+            self._trail_lines[i].set_data_3d(trail[:, 0], trail[:, 1], trail[:, 2])
+        
+        # Blitting bypasses Axes3D.draw, so project the bodies here
+        self._bodies_surf.set_verts(self._body_verts)
+        self._bodies_surf.do_3d_projection()
+        
+        return self._dynamic_artists()
     
     def visualize_interactive(self):
         """Create interactive 3D visualization"""
@@ -142,97 +427,20 @@ class SolarSystem:
         # Adjust layout to make room for controls
         plt.subplots_adjust(bottom=0.25, right=0.85)
         
-        # Get maximum orbital distance for plot limits
-        max_distance = max([self.get_scaled_distance(b.distance) for b in self.bodies])
-        
-        def draw_frame(frame):
-            """Draw single frame of animation"""
-            ax.clear()
-            
-            # Update positions
-            self.update(frame)
-            
-            # Draw orbital paths
-            if self.show_orbits:
-                for body in self.bodies[1:]:  # Skip sun
-                    orbit_points = 100
-                    angles = np.linspace(0, 2 * np.pi, orbit_points)
-                    distance = self.get_scaled_distance(body.distance)
-                    
-                    orbit_x = distance * np.cos(angles)
-                    orbit_y = distance * np.sin(angles) * np.cos(body.tilt)
-                    orbit_z = distance * np.sin(angles) * np.sin(body.tilt)
-                    
-                    ax.plot(orbit_x, orbit_y, orbit_z, 
-                           color=body.color, alpha=0.3, linestyle='--', linewidth=0.5)
-            
-            # Draw Sun
-            sun = self.bodies[0]
-            sun_radius = self.get_scaled_radius(sun.radius)
-            x, y, z = self.create_sphere(sun_radius, resolution=30)
-            ax.plot_surface(x, y, z, color=sun.color, alpha=1.0, shade=True)
-            
-            if self.show_labels:
-                ax.text(0, 0, sun_radius * 1.5, sun.name, 
-                       fontsize=10, fontweight='bold', color='white')
-            
-            # Draw planets
-            for body in self.bodies[1:]:
-                pos = body.position
-                scaled_pos = pos * np.array([
-                    self.get_scaled_distance(1) / 1,
-                    self.get_scaled_distance(1) / 1,
-                    self.get_scaled_distance(1) / 1
-                ])
-                
-                radius = self.get_scaled_radius(body.radius)
-                
-                # Draw planet
-                x, y, z = self.create_sphere(radius, center=scaled_pos, resolution=20)
-                ax.plot_surface(x, y, z, color=body.color, alpha=0.9, shade=True)
-                
-                # Draw label
-                if self.show_labels:
-                    ax.text(scaled_pos[0], scaled_pos[1], scaled_pos[2] + radius * 2,
-                           body.name, fontsize=8, color='white')
-                
-                # Draw trail
-                if body.name in self.trails and len(self.trails[body.name]) > 1:
-                    trail = np.array(self.trails[body.name])
-                    scaled_trail = trail * np.array([
-                        self.get_scaled_distance(1) / 1,
-                        self.get_scaled_distance(1) / 1,
-                        self.get_scaled_distance(1) / 1
-                    ])
-                    ax.plot(scaled_trail[:, 0], scaled_trail[:, 1], scaled_trail[:, 2],
-                           color=body.color, alpha=0.6, linewidth=1.5)
-            
-            # Set plot properties
-            ax.set_xlim([-max_distance * 1.2, max_distance * 1.2])
-            ax.set_ylim([-max_distance * 1.2, max_distance * 1.2])
-            ax.set_zlim([-max_distance * 0.5, max_distance * 0.5])
-            
-            ax.set_xlabel('X (AU)', color='white', fontsize=10)
-            ax.set_ylabel('Y (AU)', color='white', fontsize=10)
-            ax.set_zlabel('Z (AU)', color='white', fontsize=10)
-            
-            # Style
-            ax.set_facecolor('black')
-            fig.patch.set_facecolor('black')
-            ax.grid(True, alpha=0.2)
-            ax.xaxis.pane.fill = False
-            ax.yaxis.pane.fill = False
-            ax.zaxis.pane.fill = False
-            
-            title_text = f'Solar System Simulator - Scale: {self.scale_mode.title()}'
-            if self.paused:
-                title_text += ' [PAUSED]'
-            ax.set_title(title_text, color='white', fontsize=14, fontweight='bold', pad=20)
-            
-            return ax,
+        # Create artists once; frames only move them and toggle visibility
+        self._build_static_scene(fig, ax)
+        self._build_dynamic_artists(ax)
         
         # Create animation
-        anim = FuncAnimation(fig, draw_frame, frames=None, interval=50, blit=False)
+        anim = FuncAnimation(fig, self._update_dynamic, init_func=self._dynamic_artists,
+                             frames=None, interval=50, blit=True)
+        
+        # A full redraw changes the static background (e.g. toggled orbits), but
+        # FuncAnimation only refreshes its cached background on resize and would
+        # restore the stale one. Clearing its private _blit_cache forces a fresh
+        # copy; the cache only exists when the canvas actually supports blitting.
+        if anim._blit:
+            fig.canvas.mpl_connect('draw_event', lambda event: anim._blit_cache.clear())
         
         # Add control buttons
         ax_pause = plt.axes([0.15, 0.05, 0.15, 0.04])
@@ -254,9 +462,14 @@ class SolarSystem:
         
         def toggle_pause(event):
             self.paused = not self.paused
+            self._update_title()
+            fig.canvas.draw_idle()
         
         def toggle_orbits(event):
             self.show_orbits = not self.show_orbits
+            for line in self._orbit_lines:
+                line.set_visible(self.show_orbits)
+            fig.canvas.draw_idle()
         
         def toggle_labels(event):
             self.show_labels = not self.show_labels
@@ -274,16 +487,102 @@ class SolarSystem:
         btn_reset.on_clicked(reset_view)
         slider_speed.on_changed(update_speed)
         
-        # Add legend
-        legend_elements = [
-            mpatches.Patch(color=body.color, label=f"{body.name} ({body.orbital_period:.0f}d)")
-            for body in self.bodies[:5]  # First 5 planets
+        plt.show()
+    
+    def visualize_vispy(self):
+        """Create interactive 3D visualization rendered on the GPU with VisPy"""
+        if scene is None:
+            raise ImportError("visualize_vispy requires VisPy: pip install vispy")
+        
+        canvas = scene.SceneCanvas(size=(1600, 1200), bgcolor='black', keys='interactive')
+        view = canvas.central_widget.add_view()
+        max_distance = float(self._dist_scaled.max())
+        
+        def reset_view():
+            view.camera = scene.TurntableCamera(elevation=20, azimuth=45, fov=45,
+                                                distance=max_distance * 2.5)
+        
+        reset_view()
+        
+        # Orbits and the Sun are uploaded once and never touched again
+        orbit_lines = [
+            scene.visuals.Line(pos=orbit, color=Color(body.color, alpha=0.3).rgba,
+                               parent=view.scene)
+            for body, orbit in zip(self.bodies[1:], self._orbit_xyz)
         ]
-        ax.legend(handles=legend_elements, loc='upper right', 
-                 fontsize=8, facecolor='black', edgecolor='white', 
-                 labelcolor='white', framealpha=0.8)
         
-        plt.show()
+        sun = self.bodies[0]
+        sun_radius = float(self._radii_scaled[0])
+        scene.visuals.Sphere(radius=sun_radius, rows=30, cols=30, color=sun.color,
+                             shading='smooth', parent=view.scene)
+        labels = [scene.visuals.Text(sun.name, pos=(0, 0, sun_radius * 1.5), color='white',
+                                     bold=True, font_size=10, parent=view.scene)]
+        
+        # Planets are built once at the origin; frames only move their transforms
+        spheres = []
+        trail_lines = []
+        for body, radius in zip(self.bodies[1:], self._radii_scaled[1:]):
+            sphere = scene.visuals.Sphere(radius=float(radius), rows=20, cols=20, color=body.color,
+                                          shading='smooth', parent=view.scene)
+            sphere.transform = scene.transforms.STTransform()
+            spheres.append(sphere)
+            labels.append(scene.visuals.Text(body.name, color='white', font_size=8,
+                                             parent=view.scene))
+            trail_lines.append(scene.visuals.Line(color=Color(body.color, alpha=0.6).rgba,
+                                                  width=1.5, parent=view.scene))
+        
+        scaled_positions = np.empty_like(self._positions)
+        scaled_trails = np.empty_like(self._trail_buf)
+        
+        def update_title():
+            title_text = f'Solar System Simulator - Scale: {self.scale_mode.title()}'
+            if self.paused:
+                title_text += ' [PAUSED]'
+            canvas.title = title_text
+        
+        def draw_frame(event):
+            """Advance the simulation and move the planets"""
+            self.update(event.iteration)
+            
+            np.multiply(self._positions, self._pos_scale, out=scaled_positions)
+            trails = self._scale_trails(scaled_trails)
+            for i, pos in enumerate(scaled_positions):
+                spheres[i].transform.translate = pos
+                labels[i + 1].pos = (pos[0], pos[1], pos[2] + self._radii_scaled[i + 1] * 2)
+                
+                # Only hand the filled part of the trail to OpenGL
+                trail = trails[i][np.isfinite(trails[i, :, 0])]
+                if len(trail) > 1:
+                    trail_lines[i].set_data(pos=trail)
+            canvas.update()
+        
+        def on_key(event):
+            key = event.text.lower()
+            if event.key is not None and event.key.name == 'Space':
+                self.paused = not self.paused
+                update_title()
+            elif key == 'o':
+                self.show_orbits = not self.show_orbits
+                for line in orbit_lines:
+                    line.visible = self.show_orbits
+            elif key == 'l':
+                self.show_labels = not self.show_labels
+                for label in labels:
+                    label.visible = self.show_labels
+            elif key == 'r':
+                reset_view()
+            elif key in ('+', '='):
+                self.time_step = min(round(self.time_step + 0.1, 1), 10.0)
+            elif key == '-':
+                self.time_step = max(round(self.time_step - 0.1, 1), 0.1)
+        
+        canvas.events.key_press.connect(on_key)
+        update_title()
+        
+        timer = app.Timer(interval=0.05, connect=draw_frame, start=True)
+        canvas.show()
+        app.run()
+        timer.stop()
     
     def print_info(self):
         """Print information about the solar system"""
@@ -328,24 +627,42 @@ def main():
     
     # Create solar system
     print("\n[3/4] Creating solar system simulation...")
+    warm_up_stepper()  # Keep JIT compile time out of the first animation frame
     solar_system = SolarSystem(scale_mode=scale_mode)
     solar_system.print_info()
     
+    use_vispy = '--vispy' in sys.argv[1:]
+    if use_vispy and scene is None:
+        print("\n! VisPy is not installed (pip install vispy); using matplotlib instead")
+        use_vispy = False
+    
     print("\n[4/4] Launching interactive 3D visualization...")
     print("\n" + "=" * 70)
     print("CONTROLS:")
     print("=" * 70)
-    print("Mouse Controls:")
-    print("  • Click and drag       - Rotate view")
-    print("  • Scroll wheel         - Zoom in/out")
-    print("  • Right-click and drag - Pan view")
-    print("\nButton Controls:")
-    print("  • Pause/Resume  - Pause or resume animation")
-    print("  • Toggle Orbits - Show/hide orbital paths")
-    print("  • Toggle Labels - Show/hide planet names")
-    print("  • Reset View    - Return to default camera angle")
-    print("\nSlider:")
-    print("  • Speed - Adjust simulation speed (0.1x to 10x)")
+    if use_vispy:
+        print("Mouse Controls:")
+        print("  • Click and drag       - Rotate view")
+        print("  • Scroll wheel         - Zoom in/out")
+        print("  • Shift + drag         - Pan view")
+        print("\nKeyboard Controls:")
+        print("  • Space - Pause or resume animation")
+        print("  • O     - Show/hide orbital paths")
+        print("  • L     - Show/hide planet names")
+        print("  • R     - Return to default camera angle")
+        print("  • + / - - Adjust simulation speed (0.1x to 10x)")
+    else:
+        print("Mouse Controls:")
+        print("  • Click and drag       - Rotate view")
+        print("  • Scroll wheel         - Zoom in/out")
+        print("  • Right-click and drag - Pan view")
+        print("\nButton Controls:")
+        print("  • Pause/Resume  - Pause or resume animation")
+        print("  • Toggle Orbits - Show/hide orbital paths")
+        print("  • Toggle Labels - Show/hide planet names")
+        print("  • Reset View    - Return to default camera angle")
+        print("\nSlider:")
+        print("  • Speed - Adjust simulation speed (0.1x to 10x)")
     print("\nColor Legend:")
     print("  • Yellow/Gold - Sun")
     print("  • Gray/Brown  - Mercury")
@@ -361,7 +678,10 @@ def main():
     print("\nStarting simulation...\n")
     
     # Launch visualization
-    solar_system.visualize_interactive()
+    if use_vispy:
+        solar_system.visualize_vispy()
+    else:
+        solar_system.visualize_interactive()
     
     print("\n" + "=" * 70)
     print("Simulation ended. Thank you for exploring the solar system!")